@@ -12,7 +12,7 @@ import yaml
 from pydantic import BaseModel
 from pydantic.utils import deep_update
 from gammapy.makers import MapDatasetMaker
-from gammapy.utils.scripts import make_path, read_yaml
+from gammapy.utils.scripts import YAML_LOADER, make_path, read_yaml
 
 __all__ = ["AnalysisConfig"]
 
@@ -265,7 +265,7 @@ class AnalysisConfig(GammapyBaseConfig):
     @classmethod
     def from_yaml(cls, config_str):
         """Create from YAML string."""
-        settings = yaml.safe_load(config_str)
+        settings = yaml.load(config_str, Loader=YAML_LOADER)
         return AnalysisConfig(**settings)
 
     def write(self, path, overwrite=False):
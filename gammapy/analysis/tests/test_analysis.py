@@ -1,7 +1,10 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import copy
+import hashlib
 import logging
 from pathlib import Path
 import pytest
+import yaml
 from numpy.testing import assert_allclose
 import astropy.units as u
 from astropy.coordinates import SkyCoord
@@ -11,16 +14,56 @@ from gammapy.analysis import Analysis, AnalysisConfig
 from gammapy.datasets import MapDataset, SpectrumDatasetOnOff
 from gammapy.maps import WcsGeom, WcsNDMap
 from gammapy.modeling.models import DatasetModels
+from gammapy.utils.scripts import YAML_LOADER, read_yaml
 from gammapy.utils.testing import requires_data
 
 CONFIG_PATH = Path(__file__).resolve().parent / ".." / "config"
 MODEL_FILE = CONFIG_PATH / "model.yaml"
 MODEL_FILE_1D = CONFIG_PATH / "model-1d.yaml"
 
+# Parse the example configs once, every call creates a fresh `AnalysisConfig`
+EXAMPLE_CONFIGS = {
+    which: read_yaml(CONFIG_PATH / f"example-{which}.yaml") for which in ["1d", "3d"]
+}
+
 
 def get_example_config(which):
     """Example config: which can be 1d or 3d."""
-    return AnalysisConfig.read(CONFIG_PATH / f"example-{which}.yaml")
+    return AnalysisConfig(**EXAMPLE_CONFIGS[which])
+
+
+@pytest.fixture(scope="session")
+def config_from_yaml(request):
+    """Create `AnalysisConfig` from a YAML string.
+
+    The parsed settings are stored in the pytest cache, keyed by the hash of
+    the string, so they are reused in later test sessions.
+    """
+    cache = getattr(request.config, "cache", None)
+
+    def from_yaml(config_str):
+        key = "gammapy/analysis/" + hashlib.sha1(config_str.encode()).hexdigest()
+        settings = None if cache is None else cache.get(key, None)
+
+        if settings is None:
+            settings = yaml.load(config_str, Loader=YAML_LOADER)
+            if cache is not None:
+                cache.set(key, settings)
+
+        return AnalysisConfig(**settings)
+
+    return from_yaml
+
+
+@pytest.fixture(scope="session")
+def analysis_3d_template():
+    """3d example analysis with observations fetched.
+
+    Tests should work on a ``copy.deepcopy`` of it.
+    """
+    analysis = Analysis(get_example_config("3d"))
+    analysis.get_observations()
+    return analysis
 
 
 def test_init():
@@ -132,10 +175,8 @@ def test_get_observations_missing_irf():
 
 
 @requires_data()
-def test_set_models():
-    config = get_example_config("3d")
-    analysis = Analysis(config)
-    analysis.get_observations()
+def test_set_models(analysis_3d_template):
+    analysis = copy.deepcopy(analysis_3d_template)
     analysis.get_datasets()
     models_str = Path(MODEL_FILE).read_text()
     analysis.set_models(models=models_str)
@@ -152,7 +193,7 @@ def test_set_models():
 
 
 @requires_data()
-def test_analysis_1d():
+def test_analysis_1d(config_from_yaml):
     cfg = """
     observations:
         datastore: $GAMMAPY_DATA/hess-dl3-dr1
@@ -184,7 +225,7 @@ def test_analysis_1d():
     """
     config = get_example_config("1d")
     analysis = Analysis(config)
-    analysis.update_config(cfg)
+    analysis.update_config(config_from_yaml(cfg))
     analysis.get_observations()
     analysis.get_datasets()
     analysis.read_models(MODEL_FILE_1D)
@@ -211,7 +252,7 @@ def test_analysis_1d():
 
 
 @requires_data()
-def test_geom_analysis_1d():
+def test_geom_analysis_1d(config_from_yaml):
     cfg = """
     observations:
         datastore: $GAMMAPY_DATA/hess-dl3-dr1
@@ -231,7 +272,7 @@ def test_geom_analysis_1d():
     """
     config = get_example_config("1d")
     analysis = Analysis(config)
-    analysis.update_config(cfg)
+    analysis.update_config(config_from_yaml(cfg))
     analysis.get_observations()
     analysis.get_datasets()
 
@@ -273,7 +314,7 @@ def test_exclusion_region(tmp_path):
 
 
 @requires_data()
-def test_analysis_1d_stacked_no_fit_range():
+def test_analysis_1d_stacked_no_fit_range(config_from_yaml):
     cfg = """
     observations:
         datastore: $GAMMAPY_DATA/hess-dl3-dr1
@@ -292,9 +333,9 @@ def test_analysis_1d_stacked_no_fit_range():
         background:
             method: reflected
     """
-    config = AnalysisConfig.from_yaml(cfg)
+    config = config_from_yaml(cfg)
     analysis = Analysis(config)
-    analysis.update_config(cfg)
+    analysis.update_config(config_from_yaml(cfg))
     analysis.config.datasets.stack = True
     analysis.get_observations()
     analysis.get_datasets()
@@ -313,13 +354,12 @@ def test_analysis_1d_stacked_no_fit_range():
 
 
 @requires_data()
-def test_analysis_ring_background():
-    config = get_example_config("3d")
+def test_analysis_ring_background(analysis_3d_template):
+    analysis = copy.deepcopy(analysis_3d_template)
+    config = analysis.config
     config.datasets.background.method = "ring"
     config.datasets.background.parameters = {"r_in": "0.7 deg", "width": "0.7 deg"}
     config.datasets.geom.axes.energy.nbins = 1
-    analysis = Analysis(config)
-    analysis.get_observations()
     analysis.get_datasets()
     analysis.get_excess_map()
     assert isinstance(analysis.datasets[0], MapDataset)
@@ -331,12 +371,11 @@ def test_analysis_ring_background():
 
 
 @requires_data()
-def test_analysis_ring_3d():
-    config = get_example_config("3d")
+def test_analysis_ring_3d(analysis_3d_template):
+    analysis = copy.deepcopy(analysis_3d_template)
+    config = analysis.config
     config.datasets.background.method = "ring"
     config.datasets.background.parameters = {"r_in": "0.7 deg", "width": "0.7 deg"}
-    analysis = Analysis(config)
-    analysis.get_observations()
     with pytest.raises(ValueError):
         analysis.get_datasets()
 
@@ -369,10 +408,8 @@ def test_analysis_no_bkg_3d(caplog):
 
 
 @requires_data()
-def test_analysis_3d():
-    config = get_example_config("3d")
-    analysis = Analysis(config)
-    analysis.get_observations()
+def test_analysis_3d(analysis_3d_template):
+    analysis = copy.deepcopy(analysis_3d_template)
     analysis.get_datasets()
     analysis.read_models(MODEL_FILE)
     analysis.datasets["stacked"].background_model.spectral_model.tilt.frozen = False
@@ -395,11 +432,9 @@ def test_analysis_3d():
 
 
 @requires_data()
-def test_analysis_3d_joint_datasets():
-    config = get_example_config("3d")
-    config.datasets.stack = False
-    analysis = Analysis(config)
-    analysis.get_observations()
+def test_analysis_3d_joint_datasets(analysis_3d_template):
+    analysis = copy.deepcopy(analysis_3d_template)
+    analysis.config.datasets.stack = False
     analysis.get_datasets()
     assert len(analysis.datasets) == 2
 
@@ -443,11 +478,9 @@ def test_usage_errors():
 
 
 @requires_data()
-def test_datasets_io(tmpdir):
-    config = get_example_config("3d")
-
-    analysis = Analysis(config)
-    analysis.get_observations()
+def test_datasets_io(tmpdir, analysis_3d_template):
+    analysis = copy.deepcopy(analysis_3d_template)
+    config = analysis.config
     analysis.get_datasets()
     models_str = Path(MODEL_FILE).read_text()
     analysis.models = models_str
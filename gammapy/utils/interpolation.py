@@ -2,7 +2,6 @@
 """Interpolation utilities"""
 from itertools import compress
 import numpy as np
-import scipy.interpolate
 from astropy import units as u
 
 __all__ = [
@@ -52,7 +51,6 @@ class ScaledRegularGridInterpolator:
         axis=None,
         **kwargs,
     ):
-
         if points_scale is None:
             points_scale = ["lin"] * len(points)
 
@@ -60,6 +58,9 @@ class ScaledRegularGridInterpolator:
         self.scale = interpolation_scale(values_scale)
         self.axis = axis
 
+        # the inverse of these scales is never negative, so clipping is a no-op
+        self._nonneg = isinstance(self.scale, (LogScale, SqrtScale, StatProfileScale))
+
         self._include_dimensions = [len(p) > 1 for p in points]
 
         values_scaled = self.scale(values)
@@ -81,15 +82,106 @@ class ScaledRegularGridInterpolator:
         if np.any(self._include_dimensions):
             values_scaled = np.squeeze(values_scaled)
 
-        if axis is None:
+        self._points_scaled = points_scaled
+        self._kwargs = kwargs
+        self._values_shape = np.shape(values_scaled)
+        self._set_interpolator(values_scaled)
+
+    def _set_interpolator(self, values_scaled):
+        """Create the scipy interpolator and the linear fast path for the values."""
+        import scipy.interpolate
+
+        self._grid_linear = None
+
+        if self.axis is None:
             self._interpolate = scipy.interpolate.RegularGridInterpolator(
-                points=points_scaled, values=values_scaled, **kwargs
+                points=self._points_scaled, values=values_scaled, **self._kwargs
+            )
+            self._grid_linear = self._get_grid_linear(
+                self._points_scaled, values_scaled, **self._kwargs
             )
         else:
             self._interpolate = scipy.interpolate.interp1d(
-                points_scaled[0], values_scaled, axis=axis
+                self._points_scaled[0], values_scaled, axis=self.axis
+            )
+
+    def set_values(self, values):
+        """Set new values, keeping the grid of points.
+
+        For linear and nearest neighbour interpolation on ascending points the
+        values are replaced in place, otherwise the interpolator is rebuilt.
+        This avoids building a new interpolator when only the values change,
+        e.g. for profiles repeatedly sampled on the same points.
+
+        Parameters
+        ----------
+        values : `~numpy.ndarray` or `~astropy.units.Quantity`
+            New values, with the same shape and unit as the values given on init.
+        """
+        if isinstance(values, u.Quantity) != (self.scale._unit is not None):
+            raise ValueError(
+                "Values must have a unit only if the values given on init had one."
+            )
+
+        values_scaled = self.scale(values)
+
+        if np.any(self._include_dimensions):
+            values_scaled = np.squeeze(values_scaled)
+
+        if np.shape(values_scaled) != self._values_shape:
+            raise ValueError(
+                f"Shape of values {np.shape(values_scaled)} does not match "
+                f"the grid {self._values_shape}"
             )
 
+        # scipy computes nothing from the values on init for these methods, it only
+        # reorders them for descending points
+        in_place = (
+            self.axis is None
+            and self._interpolate.method in ["linear", "nearest"]
+            and all(np.all(np.diff(p) > 0) for p in self._points_scaled)
+        )
+
+        if not in_place:
+            self._set_interpolator(values_scaled)
+            return
+
+        values_scaled = np.asarray(values_scaled)
+
+        if not np.issubdtype(values_scaled.dtype, np.inexact):
+            values_scaled = values_scaled.astype(float)
+
+        self._interpolate.values = values_scaled
+        self._grid_linear = self._get_grid_linear(
+            self._points_scaled, values_scaled, **self._kwargs
+        )
+
+    @staticmethod
+    def _get_grid_linear(points, values, **kwargs):
+        """Grid for the 1D linear fast path, None if it does not apply.
+
+        Only 1D is specialised, in 2D scipy already uses a compiled kernel and
+        in 3D a NumPy version is not measurably faster than scipy.
+        """
+        is_linear = (
+            len(points) == 1
+            and np.ndim(values) == len(points)
+            and not np.iscomplexobj(values)
+            and kwargs.get("method", "linear") == "linear"
+            and kwargs.get("bounds_error") is False
+            and kwargs.get("fill_value", np.nan) is None
+        )
+
+        if not is_linear:
+            return None
+
+        grid = tuple(np.asarray(p, dtype=float) for p in points)
+
+        if not all(np.all(np.diff(p) > 0) for p in grid):
+            return None
+
+        return grid, np.asarray(values, dtype=float)
+
     def _scale_points(self, points):
         points_scaled = [scale(p) for p, scale in zip(points, self.scale_points)]
 
@@ -98,6 +190,34 @@ class ScaledRegularGridInterpolator:
 
         return tuple(points_scaled)
 
+    @staticmethod
+    def _prepare_points(points):
+        """Broadcast scaled points into a C-contiguous (ndim, N) array.
+
+        Scipy processes the coordinates one dimension at a time, so each
+        dimension is kept contiguous and the transpose is passed to it.
+
+        Parameters
+        ----------
+        points : tuple of `~numpy.ndarray`
+            Scaled coordinate arrays.
+
+        Returns
+        -------
+        points_interp : `~numpy.ndarray`
+            Coordinates of shape (ndim, N).
+        shape : tuple
+            Broadcasted shape of the points.
+        """
+        shape = np.broadcast_shapes(*[np.shape(p) for p in points])
+        ndim = len(points)
+
+        points_interp = np.empty((ndim,) + shape)
+        for idx, p in enumerate(points):
+            points_interp[idx] = p
+
+        return points_interp.reshape(ndim, -1), shape
+
     def __call__(self, points, method=None, clip=True, **kwargs):
         """Interpolate data points.
 
@@ -115,20 +235,60 @@ class ScaledRegularGridInterpolator:
         points = self._scale_points(points=points)
 
         if self.axis is None:
-            points = np.broadcast_arrays(*points)
-            points_interp = np.stack([_.flat for _ in points]).T
-            values = self._interpolate(points_interp, method, **kwargs)
-            values = self.scale.inverse(values.reshape(points[0].shape))
+            points_interp, shape = self._prepare_points(points)
+
+            use_kernel = method in [None, "linear"] and not kwargs
+
+            if self._grid_linear is not None and use_kernel:
+                values = _interpolate_linear_1d(points_interp, *self._grid_linear)
+            else:
+                values = self._interpolate(points_interp.T, method, **kwargs)
+
+            values = self.scale.inverse(values.reshape(shape))
         else:
             values = self._interpolate(points[0])
             values = self.scale.inverse(values)
 
-        if clip:
+        if clip and not self._nonneg:
             values = np.clip(values, 0, np.inf)
+        elif clip:
+            # np.clip returns scalars for 0-d input, keep that for skipped clips
+            values = values[()]
 
         return values
 
 
+def _find_indices(xp, x):
+    """Lower grid index and normalised distance, extrapolating at the edges.
+
+    Parameters
+    ----------
+    xp : `~numpy.ndarray`
+        Strictly ascending grid coordinates.
+    x : `~numpy.ndarray`
+        Coordinates to interpolate at.
+
+    Returns
+    -------
+    idx, weight : `~numpy.ndarray`
+        Lower grid index and normalised distance to it.
+    """
+    idx = np.searchsorted(xp, x) - 1
+    idx = np.clip(idx, 0, len(xp) - 2)
+    weight = (x - xp[idx]) / (xp[idx + 1] - xp[idx])
+    return idx, weight
+
+
+def _interpolate_linear_1d(coords, grid, values):
+    """Linear interpolation on a 1D grid.
+
+    Equivalent to `scipy.interpolate.RegularGridInterpolator` with
+    ``method="linear"`` and linear extrapolation, without its per call overhead.
+    """
+    i, wi = _find_indices(grid[0], coords[0])
+    return values[i] * (1 - wi) + values[i + 1] * wi
+
+
 def interpolation_scale(scale="lin"):
     """Interpolation scaling.
 
@@ -154,18 +314,28 @@ def interpolation_scale(scale="lin"):
 class InterpolationScale:
     """Interpolation scale base class."""
 
+    # unit of the values, set on the first call with `~astropy.units.Quantity` input
+    _unit = None
+
     def __call__(self, values):
-        if hasattr(self, "_unit"):
-            values = u.Quantity(values, copy=False).to_value(self._unit)
+        if self._unit is not None:
+            values = self._to_value(values, self._unit)
         else:
             if isinstance(values, u.Quantity):
                 self._unit = values.unit
                 values = values.value
         return self._scale(values)
 
+    @staticmethod
+    def _to_value(values, unit):
+        """Convert to unit, without creating a new `Quantity` from `Quantity` input."""
+        if isinstance(values, u.Quantity):
+            return values.to_value(unit)
+        return u.Quantity(values, copy=False).to_value(unit)
+
     def inverse(self, values):
         values = self._inverse(values)
-        if hasattr(self, "_unit"):
+        if self._unit is not None:
             return u.Quantity(values, self._unit, copy=False)
         else:
             return values
@@ -177,13 +347,20 @@ class LogScale(InterpolationScale):
     tiny = np.finfo(np.float32).tiny
 
     def _scale(self, values):
-        values = np.clip(values, self.tiny, np.inf)
+        values = np.maximum(values, self.tiny)
+
+        if isinstance(values, np.ndarray):
+            # the clipped array is a temporary, so take the log in place
+            return np.log(values, out=values)
+
         return np.log(values)
 
     @classmethod
     def _inverse(cls, values):
-        output = np.exp(values)
-        return np.where(abs(output) - cls.tiny <= cls.tiny, 0, output)
+        output = np.asarray(np.exp(values))
+        # the output of exp is never negative, so no abs() is needed
+        np.putmask(output, output <= 2 * cls.tiny, 0)
+        return output
 
 
 class SqrtScale(InterpolationScale):
@@ -191,12 +368,16 @@ class SqrtScale(InterpolationScale):
 
     @staticmethod
     def _scale(values):
-        sign = np.sign(values)
-        return sign * np.sqrt(sign * values)
+        output = np.sqrt(np.abs(values))
+
+        if isinstance(output, np.ndarray):
+            return np.copysign(output, values, out=output)
+
+        return np.copysign(output, values)
 
     @classmethod
     def _inverse(cls, values):
-        return np.power(values, 2)
+        return np.square(values)
 
 
 class StatProfileScale(InterpolationScale):
@@ -207,12 +388,11 @@ class StatProfileScale(InterpolationScale):
 
     def _scale(self, values):
         values = np.sign(np.gradient(values, axis=self.axis)) * values
-        sign = np.sign(values)
-        return sign * np.sqrt(sign * values)
+        return SqrtScale._scale(values)
 
     @classmethod
     def _inverse(cls, values):
-        return np.power(values, 2)
+        return np.square(values)
 
 
 class LinearScale(InterpolationScale):
@@ -246,7 +426,15 @@ def interpolate_profile(x, y, interp_scale="sqrt"):
     interp : `ScaledRegularGridInterpolator`
         Interpolator
     """
-    sign = np.sign(np.gradient(y))
+    # the profile has a single minimum, so the sign of the slope follows from
+    # the position relative to it. At the minimum itself the slope of the
+    # neighbours is used, as it tells on which side the true minimum lies.
+    idx = np.argmin(y)
+    sign = np.ones_like(y, dtype=float)
+    sign[:idx] = -1
+
+    lo = max(idx - 1, 0)
+    sign[idx] = np.sign(np.gradient(y[lo : idx + 2]))[idx - lo]
     return ScaledRegularGridInterpolator(
         points=(x,), values=sign * y, values_scale=interp_scale
     )
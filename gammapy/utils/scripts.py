@@ -18,6 +18,9 @@ __all__ = [
 PATH_DOCS = Path(__file__).resolve().parent / ".." / ".." / "docs"
 SKIP = ["_static", "_build", "_checkpoints", "docs/user-guide/model-gallery/"]
 
+# Use the libyaml based loader if available, it is much faster than the pure Python one
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def get_images_paths(folder=PATH_DOCS):
     """Generator yields a Path for each image used in notebook.
@@ -52,7 +55,7 @@ def read_yaml(filename, logger=None):
         logger.info(f"Reading {path}")
 
     text = path.read_text()
-    return yaml.safe_load(text)
+    return yaml.load(text, Loader=YAML_LOADER)
 
 
 def write_yaml(dictionary, filename, logger=None, sort_keys=True):
@@ -1,6 +1,14 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import pickle
+import pytest
 import numpy as np
-from gammapy.utils.interpolation import LogScale
+from scipy.interpolate import RegularGridInterpolator
+import astropy.units as u
+from gammapy.utils.interpolation import (
+    LogScale,
+    ScaledRegularGridInterpolator,
+    interpolate_profile,
+)
 from gammapy.utils.testing import assert_allclose
 
 
@@ -12,3 +20,175 @@ def test_LogScale_inverse():
     assert_allclose(log_values, np.array([0, np.log(1e-5), np.log(tiny)]))
     inv_values = log_scale.inverse(log_values)
     assert_allclose(inv_values, np.array([1, 1e-5, 0]))
+
+
+def test_ScaledRegularGridInterpolator_linear_1d():
+    x = np.array([1.0, 2.0, 4.0, 8.0])
+    y = np.array([2.0, 1.0, 3.0, 4.0])
+
+    interp = ScaledRegularGridInterpolator(points=(x,), values=y)
+
+    x_eval = np.array([[0.5, 1.0, 3.5], [5.0, 8.0, 10.0]])
+    values = interp((x_eval,), clip=False)
+    expected = RegularGridInterpolator(
+        points=(x,), values=y, bounds_error=False, fill_value=None
+    )(x_eval[..., np.newaxis])
+
+    assert values.shape == (2, 3)
+    assert_allclose(values, expected)
+    assert_allclose(interp((x_eval,), method="nearest"), [[2, 2, 3], [3, 4, 4]])
+
+    interp_desc = ScaledRegularGridInterpolator(points=(x[::-1],), values=y[::-1])
+    assert_allclose(interp_desc((x_eval,), clip=False), expected)
+
+
+def test_ScaledRegularGridInterpolator_linear_3d():
+    rng = np.random.RandomState(0)
+    points = (np.arange(3.0), np.arange(4.0), np.arange(5.0))
+    values = rng.uniform(size=(3, 4, 5))
+
+    interp = ScaledRegularGridInterpolator(points=points, values=values)
+
+    coords = (rng.uniform(-1, 3, 10), rng.uniform(-1, 4, 10), rng.uniform(-1, 5, 10))
+    expected = RegularGridInterpolator(
+        points=points, values=values, bounds_error=False, fill_value=None
+    )(np.stack(coords, axis=-1))
+
+    assert_allclose(interp(coords, clip=False), expected, rtol=1e-15)
+
+
+@pytest.mark.parametrize("values_scale", ["lin", "log", "sqrt", "stat-profile"])
+def test_ScaledRegularGridInterpolator_scalar(values_scale):
+    points = (np.arange(1, 5.0), np.arange(3.0))
+    values = np.ones((4, 3)) * points[0][:, np.newaxis]
+    interp = ScaledRegularGridInterpolator(
+        points=points, values=values, values_scale=values_scale
+    )
+
+    value = interp((2.5, 1.0))
+    assert isinstance(value, np.float64)
+
+    values = interp(([2.5], [1.0]))
+    assert values.shape == (1,)
+    assert_allclose(value, values[0])
+
+
+def test_ScaledRegularGridInterpolator_pickle():
+    points = (np.arange(3.0), np.arange(4.0))
+    values = np.arange(12.0).reshape(3, 4)
+    interp = ScaledRegularGridInterpolator(points=points, values=values)
+
+    interp_new = pickle.loads(pickle.dumps(interp))
+
+    coords = (np.array([0.5, 1.5]), np.array([2.5, 0.5]))
+    assert_allclose(interp_new(coords), interp(coords))
+
+
+@pytest.mark.parametrize("values_scale", ["lin", "log", "sqrt"])
+@pytest.mark.parametrize("method", ["linear", "nearest", "cubic"])
+def test_ScaledRegularGridInterpolator_set_values(values_scale, method):
+    points = (np.arange(1.0, 5.0), np.arange(1.0, 6.0))
+    values = np.arange(1.0, 21.0).reshape(4, 5)
+    kwargs = dict(values_scale=values_scale, method=method)
+    interp = ScaledRegularGridInterpolator(points=points, values=values, **kwargs)
+
+    interp.set_values(values**2)
+    expected = ScaledRegularGridInterpolator(points=points, values=values**2, **kwargs)
+
+    coords = (np.array([0.5, 1.5, 3.5]), np.array([2.5, 0.5, 4.5]))
+    assert_allclose(interp(coords), expected(coords))
+
+    with pytest.raises(ValueError):
+        interp.set_values(values[:2])
+
+    with pytest.raises(ValueError):
+        interp.set_values(values * u.km)
+
+
+def test_ScaledRegularGridInterpolator_set_values_descending():
+    points = (np.array([4.0, 3.0, 2.0, 1.0]), np.arange(1.0, 6.0))
+    values = np.arange(1.0, 21.0).reshape(4, 5)
+    interp = ScaledRegularGridInterpolator(points=points, values=values)
+
+    interp.set_values(values**2)
+    expected = ScaledRegularGridInterpolator(points=points, values=values**2)
+
+    coords = (np.array([1.5, 2.2, 3.7]), np.array([2.5, 1.5, 4.5]))
+    assert_allclose(interp(coords), expected(coords))
+
+
+def test_ScaledRegularGridInterpolator_set_values_axis():
+    points = (np.arange(1.0, 6.0),)
+    values = np.arange(1.0, 16.0).reshape(3, 5) * u.m
+    interp = ScaledRegularGridInterpolator(points=points, values=values, axis=1)
+
+    interp.set_values((values**2 / u.m).to("km"))
+    expected = ScaledRegularGridInterpolator(
+        points=points, values=values**2 / u.m, axis=1
+    )
+
+    coords = (np.array([1.5, 2.2, 3.7]),)
+    assert_allclose(interp(coords), expected(coords))
+    assert interp(coords).unit == "m"
+
+
+def test_ScaledRegularGridInterpolator_linear_4d():
+    rng = np.random.RandomState(0)
+    points = (np.arange(3.0), np.arange(4.0), np.arange(5.0), np.arange(2.0))
+    values = rng.uniform(size=(3, 4, 5, 2))
+
+    interp = ScaledRegularGridInterpolator(points=points, values=values)
+
+    coords = tuple(rng.uniform(-1, len(p), 10) for p in points)
+    expected = RegularGridInterpolator(
+        points=points, values=values, bounds_error=False, fill_value=None
+    )(np.stack(coords, axis=-1))
+
+    assert_allclose(interp(coords, clip=False), expected, rtol=1e-15)
+
+
+@pytest.mark.parametrize("interp_scale", ["sqrt", "lin"])
+def test_interpolate_profile_parabola(interp_scale):
+    x = np.linspace(-2, 2, 9)
+    y = x**2
+    interp = interpolate_profile(x, y, interp_scale=interp_scale)
+
+    # the branch right of the minimum is used to solve for upper limits
+    assert_allclose(interp((x[4:],)), y[4:])
+    if interp_scale == "sqrt":
+        assert_allclose(interp((x,)), y)
+        assert_allclose(interp(([-0.25, 0.25],)), 0.0625)
+
+
+@pytest.mark.parametrize("interp_scale", ["sqrt", "lin"])
+def test_interpolate_profile_minimum_at_edges(interp_scale):
+    x = np.arange(5.0)
+    y = x**2 + 1
+    interp = interpolate_profile(x, y, interp_scale=interp_scale)
+    assert_allclose(interp((x,)), y)
+
+    interp = interpolate_profile(x, y[::-1], interp_scale="sqrt")
+    assert_allclose(interp((x,)), y[::-1])
+
+
+def test_interpolate_profile_symmetric_minimum():
+    x = np.arange(5.0)
+    y = np.array([4, 1, 0, 1, 4.0])
+    interp = interpolate_profile(x, y, interp_scale="sqrt")
+    assert_allclose(interp((x,)), y)
+    assert_allclose(interp(([1.5, 2.5],)), 0.25)
+
+
+@pytest.mark.parametrize(
+    "interp_scale, expected",
+    [
+        ("sqrt", [5, 5, 5, 3, 1, 0, 1, 3, 3]),
+        ("lin", [0, 0, 0, 0, 0, 0, 1, 3, 3]),
+    ],
+)
+def test_interpolate_profile_plateau(interp_scale, expected):
+    x = np.arange(9.0)
+    y = np.array([5, 5, 5, 3, 1, 0, 1, 3, 3.0])
+    interp = interpolate_profile(x, y, interp_scale=interp_scale)
+    assert_allclose(interp((x,)), expected)
+    assert_allclose(interp(([7.5],)), 3)